@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -124,6 +125,15 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Shared between worker processes so upload progress published by one
+# worker can be streamed by another (see gunicorn.conf.py).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('CHEMSCOPE_CACHE_DIR', BASE_DIR / 'cache'),
+    }
+}
+
 # For local development allow all origins (change for production)
 CORS_ALLOW_ALL_ORIGINS = True
 
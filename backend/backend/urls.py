@@ -16,13 +16,14 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path
-from equipment.views import upload_csv, datasets_list, dataset_preview
+from equipment.views import upload_csv, upload_progress, datasets_list, dataset_preview
 from django.conf import settings
 from django.conf.urls.static import static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('upload/', upload_csv),
+    path('upload/<uuid:upload_id>/progress/', upload_progress),
     path('datasets/', datasets_list),
     path('datasets/<int:pk>/preview/', dataset_preview),
 ]
@@ -0,0 +1,22 @@
+import importlib
+
+
+# Heavy libraries the views import lazily. Loading them in a pre-fork
+# master process lets every worker share the pages copy-on-write and
+# keeps the first request from paying the import cost.
+HEAVY_MODULES = (
+    "pandas",
+    "reportlab.pdfgen.canvas",
+    "pypdf",
+)
+
+# The URLconf pulls in the views and DRF; Django is already set up in
+# the master because preload_app loads backend.asgi first.
+APP_MODULES = (
+    "backend.urls",
+)
+
+
+def preload():
+    for name in HEAVY_MODULES + APP_MODULES:
+        importlib.import_module(name)
@@ -0,0 +1,64 @@
+import asyncio
+import json
+import time
+
+from django.core.cache import cache
+
+
+# ---------- SETTINGS ----------
+CACHE_PREFIX = "upload-progress:"
+STATE_TTL = 60 * 30          # keep finished states around for late subscribers
+POLL_INTERVAL = 0.25         # how often the stream checks for a new state
+KEEPALIVE_INTERVAL = 15      # SSE comment so proxies don't drop idle streams
+WAIT_TIMEOUT = 60 * 10       # give up if nothing is published for this long
+
+FINAL_STAGES = ("done", "error")
+
+
+# ---------- PUBLISH ----------
+def publish(upload_id, stage, percent, **fields):
+    """Store the latest progress state for an upload (no-op without an id)."""
+    if not upload_id:
+        return
+
+    state = {"stage": stage, "percent": int(percent), **fields}
+    cache.set(f"{CACHE_PREFIX}{upload_id}", state, STATE_TTL)
+
+
+def get_state(upload_id):
+    return cache.get(f"{CACHE_PREFIX}{upload_id}")
+
+
+# ---------- SSE STREAM ----------
+def format_event(state):
+    return f"event: progress\ndata: {json.dumps(state)}\n\n"
+
+
+async def stream_events(upload_id):
+    """Yield SSE frames whenever the stored state changes, until it finishes."""
+    yield "retry: 1000\n\n"
+
+    last_state = None
+    last_change = last_sent = time.monotonic()
+
+    while True:
+        state = await cache.aget(f"{CACHE_PREFIX}{upload_id}")
+        now = time.monotonic()
+
+        if state is not None and state != last_state:
+            yield format_event(state)
+            last_state = state
+            last_change = last_sent = now
+
+            if state["stage"] in FINAL_STAGES:
+                return
+
+        elif now - last_change > WAIT_TIMEOUT:
+            yield format_event({"stage": "error", "percent": 0, "error": "Timed out"})
+            return
+
+        elif now - last_sent > KEEPALIVE_INTERVAL:
+            yield ": keep-alive\n\n"
+            last_sent = now
+
+        await asyncio.sleep(POLL_INTERVAL)
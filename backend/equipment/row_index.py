@@ -0,0 +1,134 @@
+import csv
+import json
+import os
+
+
+# ---------- SETTINGS ----------
+INDEX_STRIDE = 1000          # record the byte offset of every Nth data row
+INDEX_SUFFIX = ".idx.json"
+
+SNIFF_BYTES = 64 * 1024
+READ_BLOCK = 1024 * 1024
+
+
+def index_path(csv_path):
+    return f"{csv_path}{INDEX_SUFFIX}"
+
+
+# ---------- BUILD ----------
+def detect_terminator(f):
+    """Line terminator of the file: `\\r` for CR-only (old Mac/Excel) CSVs."""
+    head = f.read(SNIFF_BYTES)
+    f.seek(0)
+    if b"\r" in head and b"\n" not in head:
+        return b"\r"
+    return b"\n"
+
+
+def iter_lines(f, terminator):
+    """Binary lines, each keeping its terminator, split on `terminator`."""
+    if terminator == b"\n":
+        yield from f
+        return
+
+    rest = b""
+    while True:
+        block = f.read(READ_BLOCK)
+        if not block:
+            break
+        lines = (rest + block).split(terminator)
+        rest = lines.pop()
+        for line in lines:
+            yield line + terminator
+    if rest:
+        yield rest
+
+
+def build_index(csv_path, stride=INDEX_STRIDE):
+    """
+    Scan the CSV once and persist a sparse index next to it:
+    the byte offset where every `stride`-th data row starts.
+
+    Records are split by the csv module, which quotes like pandas
+    (a quote only opens a field at its start, `""` is an escaped
+    quote) and pulls in only the lines of the current record, so
+    the byte offset before each record is its start. Blank lines
+    are skipped the same way pandas skips them.
+    """
+    offsets = []
+    rows = 0
+    consumed = 0
+    header_seen = False
+
+    with open(csv_path, "rb") as f:
+        terminator = detect_terminator(f)
+
+        def lines():
+            nonlocal consumed
+            for line in iter_lines(f, terminator):
+                consumed += len(line)
+                # latin-1 keeps every byte as one char; quotes, commas
+                # and newlines are ASCII in any ASCII-compatible encoding
+                yield line.decode("latin-1")
+
+        start = 0
+        for record in csv.reader(lines()):
+            blank = not record or (len(record) == 1 and not record[0].strip())
+            if not blank:
+                if not header_seen:
+                    header_seen = True
+                else:
+                    if rows % stride == 0:
+                        offsets.append(start)
+                    rows += 1
+
+            start = consumed
+
+    index = {
+        "stride": stride,
+        "size": os.path.getsize(csv_path),
+        "rows": rows,
+        "offsets": offsets,
+    }
+
+    with open(index_path(csv_path), "w") as f:
+        json.dump(index, f)
+
+    return index
+
+
+def load_index(csv_path):
+    """Return the persisted index, (re)building it if missing or stale."""
+    try:
+        with open(index_path(csv_path)) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return build_index(csv_path)
+
+    if index.get("size") != os.path.getsize(csv_path):
+        return build_index(csv_path)
+
+    return index
+
+
+# ---------- PAGING ----------
+def read_page(csv_path, offset, limit):
+    """
+    Read `limit` rows starting at data row `offset`: one seek to the
+    nearest indexed row, then a parse of at most stride + limit rows.
+    """
+    import pandas as pd
+
+    index = load_index(csv_path)
+    columns = list(pd.read_csv(csv_path, nrows=0).columns)
+
+    if offset >= index["rows"] or limit <= 0:
+        return columns, pd.DataFrame(columns=columns), index["rows"]
+
+    block, skip = divmod(offset, index["stride"])
+
+    with open(csv_path, "rb") as f:
+        f.seek(index["offsets"][block])
+        df = pd.read_csv(f, header=None, names=columns, nrows=skip + limit)
+
+    return columns, df.iloc[skip:], index["rows"]
@@ -1,3 +1,248 @@
-from django.test import TestCase
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import uuid
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from . import preload, progress, row_index, views
+
+
+CSV = (
+    "Equipment Name,Type,Flowrate,Pressure,Temperature\n"
+    "Pump-1,Pump,120,5.2,110\n"
+    "Valve-1,Valve,60,4.1,105\n"
+    "Pump-2,Pump,130,5.6,118\n"
+)
+
+
+class UploadTestCase(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+        )
+        self.settings_override.enable()
+        cache.clear()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def upload(self, content=CSV, **data):
+        file = SimpleUploadedFile("data.csv", content.encode(), content_type="text/csv")
+        return self.client.post("/upload/", {"file": file, **data})
+
+
+# ---------- UPLOAD PROGRESS ----------
+class UploadProgressTests(UploadTestCase):
+    def collect_events(self, upload_id):
+        async def collect():
+            return [frame async for frame in progress.stream_events(upload_id)]
+        return async_to_sync(collect)()
+
+    def test_upload_publishes_final_state(self):
+        upload_id = str(uuid.uuid4())
+        r = self.upload(upload_id=upload_id)
+
+        self.assertEqual(r.status_code, 200)
+        state = progress.get_state(upload_id)
+        self.assertEqual(state["stage"], "done")
+        self.assertEqual(state["percent"], 100)
+        self.assertEqual(state["rows"], 3)
+        self.assertEqual(state["dataset_id"], r.json()["dataset_id"])
+
+    def test_parsing_publishes_intermediate_states(self):
+        upload_id = str(uuid.uuid4())
+
+        with mock.patch.object(views, "CSV_CHUNK_ROWS", 1), \
+                mock.patch.object(progress, "publish", wraps=progress.publish) as publish:
+            self.upload(upload_id=upload_id)
+
+        states = [(c.args[1], c.kwargs) for c in publish.call_args_list]
+        stages = [stage for stage, _ in states]
+        self.assertEqual(
+            stages,
+            ["receiving", "parsing", "parsing", "parsing",
+             "summarizing", "report", "done"]
+        )
+
+        parsing = [fields for stage, fields in states if stage == "parsing"]
+        self.assertEqual([p["rows"] for p in parsing], [1, 2, 3])
+        self.assertEqual(parsing[-1]["total_bytes"], len(CSV))
+        for fields in parsing:
+            self.assertLessEqual(fields["bytes"], fields["total_bytes"])
+
+        percents = [c.args[2] for c in publish.call_args_list]
+        self.assertEqual(percents, sorted(percents))
+
+    def test_stream_sends_intermediate_state_before_final(self):
+        upload_id = str(uuid.uuid4())
+        progress.publish(upload_id, "parsing", 40, rows=1, bytes=10, total_bytes=20)
+
+        async def collect():
+            frames = []
+            async for frame in progress.stream_events(upload_id):
+                frames.append(frame)
+                if len(frames) == 2:
+                    progress.publish(upload_id, "done", 100, rows=3)
+            return frames
+
+        frames = async_to_sync(collect)()
+
+        self.assertEqual(frames[1:], [
+            progress.format_event(
+                {"stage": "parsing", "percent": 40, "rows": 1, "bytes": 10, "total_bytes": 20}
+            ),
+            progress.format_event({"stage": "done", "percent": 100, "rows": 3}),
+        ])
+
+    def test_missing_column_publishes_error(self):
+        upload_id = str(uuid.uuid4())
+        r = self.upload(content="Type,Pressure\nPump,5\n", upload_id=upload_id)
+
+        self.assertEqual(r.status_code, 400)
+        self.assertEqual(progress.get_state(upload_id)["stage"], "error")
+
+    def test_stream_ends_after_final_state(self):
+        upload_id = str(uuid.uuid4())
+        progress.publish(upload_id, "done", 100, rows=3)
+
+        frames = self.collect_events(upload_id)
+
+        self.assertEqual(frames[-1], progress.format_event(
+            {"stage": "done", "percent": 100, "rows": 3}
+        ))
+
+
+# ---------- PAGED PREVIEW ----------
+class RowIndexTests(UploadTestCase):
+    def write_csv(self, rows):
+        path = os.path.join(self.media_root, "big.csv")
+        with open(path, "w", newline="") as f:
+            f.write("Type,Pressure,Temperature,Note\n")
+            for i in range(rows):
+                note = f'"multi\nline {i}"' if i % 7 == 0 else f"n{i}"
+                f.write(f"Pump,{i},{i * 2},{note}\n")
+        return path
+
+    def test_pages_match_full_parse(self):
+        path = self.write_csv(257)
+        index = row_index.build_index(path, stride=10)
+
+        self.assertEqual(index["rows"], 257)
+        self.assertEqual(len(index["offsets"]), 26)
+        self.assertTrue(os.path.exists(row_index.index_path(path)))
+
+        for offset, limit in [(0, 5), (9, 3), (10, 10), (123, 40), (250, 20)]:
+            _, page, total = row_index.read_page(path, offset, limit)
+            self.assertEqual(total, 257)
+            self.assertEqual(
+                list(page["Pressure"]),
+                list(range(offset, min(offset + limit, 257)))
+            )
+
+    def test_stray_quotes_in_unquoted_fields_are_literal(self):
+        path = os.path.join(self.media_root, "inches.csv")
+        with open(path, "w", newline="") as f:
+            f.write(
+                "Type,Pressure,Temperature,Size\n"
+                'Pump,1,2,3"\n'
+                'Pump,2,3,"say ""4"""\n'
+                'Pump,3,4,5 1/2"\n'
+                "Pump,4,5,6\n"
+            )
+
+        self.assertEqual(row_index.build_index(path, stride=2)["rows"], 4)
+
+        _, page, total = row_index.read_page(path, 1, 2)
+        self.assertEqual(total, 4)
+        self.assertEqual(list(page["Pressure"]), [2, 3])
+        self.assertEqual(list(page["Size"]), ['say "4"', '5 1/2"'])
+
+    def test_cr_only_line_endings(self):
+        path = os.path.join(self.media_root, "mac.csv")
+        with open(path, "w", newline="") as f:
+            f.write("Type,Pressure,Temperature\rPump,1,2\r\"Val\rve\",2,3\rPump,3,4\r")
+
+        _, page, total = row_index.read_page(path, 1, 5)
+
+        self.assertEqual(total, 3)
+        self.assertEqual(list(page["Pressure"]), [2, 3])
+        self.assertEqual(list(page["Type"]), ["Val\rve", "Pump"])
+
+    def test_index_is_built_on_first_preview(self):
+        dataset_id = self.upload().json()["dataset_id"]
+        path = os.path.join(self.media_root, "uploads", "data.csv")
+        self.assertFalse(os.path.exists(row_index.index_path(path)))
+
+        self.client.get(f"/datasets/{dataset_id}/preview/")
+
+        self.assertTrue(os.path.exists(row_index.index_path(path)))
+
+    def test_stale_index_is_rebuilt(self):
+        path = self.write_csv(5)
+        row_index.build_index(path)
+        with open(path, "a") as f:
+            f.write("Valve,99,98,x\n")
+
+        self.assertEqual(row_index.load_index(path)["rows"], 6)
+
+    def test_preview_endpoint_pages(self):
+        dataset_id = self.upload().json()["dataset_id"]
+
+        r = self.client.get(f"/datasets/{dataset_id}/preview/", {"offset": 1, "limit": 1})
+
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json()["total_rows"], 3)
+        self.assertEqual(r.json()["rows"][0]["Equipment Name"], "Valve-1")
+
+    def test_preview_rejects_bad_paging(self):
+        dataset_id = self.upload().json()["dataset_id"]
+
+        r = self.client.get(f"/datasets/{dataset_id}/preview/", {"offset": "x"})
+
+        self.assertEqual(r.status_code, 400)
+
+
+# ---------- COLD START ----------
+class ImportTimeTests(SimpleTestCase):
+    URLCONF_BUDGET_US = 300_000   # ~90ms measured locally without the heavy libs
+
+    def import_times(self):
+        """Run a fresh interpreter with -X importtime and parse its report."""
+        result = subprocess.run(
+            [
+                sys.executable, "-X", "importtime", "-c",
+                "import django; django.setup(); import backend.urls",
+            ],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "backend.settings"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        times = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "imported package" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            times[name.strip()] = int(cumulative)
+        return times
+
+    def test_startup_skips_heavy_modules_and_meets_budget(self):
+        times = self.import_times()
+
+        for name in preload.HEAVY_MODULES:
+            self.assertNotIn(name.split(".")[0], times)
+        self.assertLess(times["backend.urls"], self.URLCONF_BUDGET_US)
 
-# Create your tests here.
@@ -1,38 +1,46 @@
 import os
-import pandas as pd
 from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
-from reportlab.pdfgen import canvas   # ✅ FIXED
-from pypdf import PdfReader, PdfWriter
 from .models import Dataset
+from . import progress, row_index
+
+# pandas, reportlab and pypdf are imported inside the functions that use
+# them so manage.py commands, migrations and tests start fast; production
+# servers warm them up front via equipment.preload.
+
+
+CSV_CHUNK_ROWS = 50_000
+PREVIEW_MAX_LIMIT = 500
 
 
 @api_view(['POST'])
 def upload_csv(request):
+    upload_id = request.data.get('upload_id')
+
     try:
         # ---------- FILE CHECK ----------
         file = request.FILES.get('file')
         if not file:
-            return Response({'error': 'No file provided'}, status=400)
+            return upload_error(upload_id, 'No file provided', 400)
 
         # ---------- SAVE DATASET ----------
+        progress.publish(upload_id, "receiving", 0, total_bytes=file.size)
         ds = Dataset(filename=file.name)
         ds.file.save(file.name, file)
 
         # ---------- READ CSV ----------
-        df = pd.read_csv(ds.file.path)
+        df = read_csv_with_progress(ds.file.path, upload_id)
 
         REQUIRED_COLUMNS = ['Type', 'Pressure', 'Temperature']
         for col in REQUIRED_COLUMNS:
             if col not in df.columns:
-                return Response(
-                    {'error': f'Missing column: {col}'},
-                    status=400
-                )
+                return upload_error(upload_id, f'Missing column: {col}', 400)
 
         # ---------- SUMMARY ----------
+        progress.publish(upload_id, "summarizing", 75, rows=int(len(df)))
         summary = {
             "total_rows": int(len(df)),
             "average_pressure": round(df['Pressure'].mean(), 2),
@@ -44,6 +52,7 @@ def upload_csv(request):
         ds.save()
 
         # ---------- PDF GENERATION ----------
+        progress.publish(upload_id, "report", 85, rows=summary["total_rows"])
         pdf_path = generate_pdf(summary, ds.id)
 
         protected_pdf_path = protect_pdf(
@@ -57,6 +66,12 @@ def upload_csv(request):
 
         report_url = request.build_absolute_uri(protected_pdf_path)
 
+        progress.publish(
+            upload_id, "done", 100,
+            rows=summary["total_rows"],
+            dataset_id=ds.id
+        )
+
         return Response({
             "message": "CSV uploaded successfully",
             "data": summary,
@@ -67,14 +82,49 @@ def upload_csv(request):
 
     except Exception as e:
         print("UPLOAD ERROR:", str(e))  # 🔥 SEE THIS IN TERMINAL
-        return Response(
-            {"error": str(e)},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        return upload_error(
+            upload_id,
+            str(e),
+            status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
 
+def upload_error(upload_id, message, status_code):
+    progress.publish(upload_id, "error", 100, error=message)
+    return Response({'error': message}, status=status_code)
+
+
+# ---------- CSV PARSING ----------
+def read_csv_with_progress(path, upload_id):
+    """Parse the CSV in chunks, publishing rows/bytes processed as it goes."""
+    import pandas as pd
+
+    total_bytes = os.path.getsize(path) or 1
+    chunks = []
+    rows = 0
+
+    with open(path, 'rb') as f:
+        for chunk in pd.read_csv(f, chunksize=CSV_CHUNK_ROWS):
+            chunks.append(chunk)
+            rows += len(chunk)
+            processed = min(f.tell(), total_bytes)
+            progress.publish(
+                upload_id, "parsing", 5 + 65 * processed / total_bytes,
+                rows=rows,
+                bytes=processed,
+                total_bytes=total_bytes
+            )
+
+    if not chunks:
+        return pd.read_csv(path)
+
+    return pd.concat(chunks, ignore_index=True)
+
+
 # ---------- PDF PROTECTION ----------
 def protect_pdf(input_pdf_path, password, dataset_id):
+    from pypdf import PdfReader, PdfWriter
+
     reader = PdfReader(input_pdf_path)
     writer = PdfWriter()
 
@@ -96,12 +146,9 @@ def protect_pdf(input_pdf_path, password, dataset_id):
 
 
 # ---------- PDF CREATION ----------
-from reportlab.pdfgen import canvas
-from django.conf import settings
-import os
-
-
 def generate_pdf(data, dataset_id):
+    from reportlab.pdfgen import canvas
+
     # ---------- PATHS ----------
     reports_dir = os.path.join(settings.MEDIA_ROOT, "reports")
     os.makedirs(reports_dir, exist_ok=True)
@@ -179,13 +226,36 @@ def datasets_list(request):
 # ---------- PREVIEW ----------
 @api_view(['GET'])
 def dataset_preview(request, pk):
+    try:
+        offset = int(request.GET.get('offset', 0))
+        limit = min(int(request.GET.get('limit', 10)), PREVIEW_MAX_LIMIT)
+    except ValueError:
+        return Response({'error': 'offset and limit must be integers'}, status=400)
+
+    if offset < 0 or limit < 1:
+        return Response({'error': 'offset must be >= 0 and limit >= 1'}, status=400)
+
     try:
         ds = Dataset.objects.get(pk=pk)
-        df = pd.read_csv(ds.file.path, nrows=10)
+        columns, df, total_rows = row_index.read_page(ds.file.path, offset, limit)
 
         return Response({
-            'columns': list(df.columns),
-            'rows': df.fillna('').to_dict(orient='records')
+            'columns': columns,
+            'rows': df.fillna('').to_dict(orient='records'),
+            'offset': offset,
+            'limit': limit,
+            'total_rows': total_rows
         })
     except Exception as e:
         return Response({'error': str(e)}, status=500)
+
+
+# ---------- UPLOAD PROGRESS (SSE) ----------
+async def upload_progress(request, upload_id):
+    response = StreamingHttpResponse(
+        progress.stream_events(str(upload_id)),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
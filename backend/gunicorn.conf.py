@@ -0,0 +1,32 @@
+"""
+Production server profile.
+
+    cd backend && gunicorn backend.asgi:application
+
+Gunicorn picks this file up from the working directory. The app and the
+heavy libraries it imports lazily are loaded once in the master, then
+workers are forked and share that memory copy-on-write.
+"""
+import gc
+import multiprocessing
+import os
+
+
+bind = os.environ.get("CHEMSCOPE_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("CHEMSCOPE_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+
+# ASGI worker so the upload progress stream (SSE) works
+worker_class = "uvicorn_worker.UvicornWorker"
+
+preload_app = True
+
+
+def on_starting(server):
+    from equipment.preload import preload
+    preload()
+
+
+def pre_fork(server, worker):
+    # move everything loaded so far out of the GC's reach so collections
+    # in workers don't touch (and un-share) the preloaded pages
+    gc.freeze()
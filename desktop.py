@@ -1,13 +1,15 @@
 import sys
 import os
 import time
+import json
+import uuid
 import requests
 
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QPushButton, QFileDialog,
     QVBoxLayout, QHBoxLayout, QLabel, QMessageBox, QSizePolicy
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QIcon, QPixmap, QPainter
 
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -19,7 +21,17 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 BG_IMAGE = os.path.join(BASE_DIR, "assets", "background.jpg")
 APP_ICON = os.path.join(BASE_DIR, "assets", "app_icon.ico")
 
-API_UPLOAD_URL = "http://127.0.0.1:8000/upload/"
+API_BASE_URL = "http://127.0.0.1:8000"
+API_UPLOAD_URL = f"{API_BASE_URL}/upload/"
+API_PROGRESS_URL = API_BASE_URL + "/upload/{}/progress/"
+
+STAGE_LABELS = {
+    "receiving": "Receiving file",
+    "parsing": "Parsing rows",
+    "summarizing": "Summarizing",
+    "report": "Building PDF report",
+    "done": "Finishing",
+}
 # =========================================
 
 
@@ -32,6 +44,97 @@ class ChartCanvas(FigureCanvas):
         self.setParent(parent)
 
 
+# ================= WORKERS =================
+class CancellableWorker(QThread):
+    # cancelled workers still running; kept alive here so the
+    # QThread isn't destroyed (and Qt doesn't abort) before run() returns
+    detached = set()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.cancelled = False
+
+    def cancel(self):
+        """Drop the result and return immediately; run() exits on its own."""
+        self.cancelled = True
+        if not self.isRunning():
+            return
+
+        self.setParent(None)
+        CancellableWorker.detached.add(self)
+        self.finished.connect(self.release)
+
+    def release(self):
+        CancellableWorker.detached.discard(self)
+        self.deleteLater()
+
+
+class UploadWorker(CancellableWorker):
+    succeeded = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, path, upload_id, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.upload_id = upload_id
+
+    def run(self):
+        try:
+            with open(self.path, "rb") as f:
+                r = requests.post(
+                    API_UPLOAD_URL,
+                    files={"file": f},
+                    data={"upload_id": self.upload_id},
+                    timeout=300
+                )
+
+            if self.cancelled:
+                return
+
+            if r.status_code != 200:
+                self.failed.emit(r.text)
+                return
+
+            self.succeeded.emit(r.json())
+
+        except Exception as e:
+            if not self.cancelled:
+                self.failed.emit(str(e))
+
+
+class ProgressWorker(CancellableWorker):
+    progress = pyqtSignal(dict)
+
+    def __init__(self, upload_id, parent=None):
+        super().__init__(parent)
+        self.upload_id = upload_id
+
+    def run(self):
+        # Server-Sent Events: one "data: {...}" line per progress update.
+        # The server sends a keep-alive every 15s, so the read timeout
+        # bounds how long a cancelled worker lingers.
+        try:
+            with requests.get(
+                API_PROGRESS_URL.format(self.upload_id),
+                stream=True,
+                timeout=(5, 20)
+            ) as r:
+                for line in r.iter_lines(decode_unicode=True):
+                    if self.cancelled:
+                        return
+                    if not line or not line.startswith("data:"):
+                        continue
+
+                    state = json.loads(line[len("data:"):])
+                    self.progress.emit(state)
+
+                    if state.get("stage") in ("done", "error"):
+                        return
+
+        except (requests.RequestException, OSError, ValueError):
+            pass  # progress is best-effort, the upload result still arrives
+
+
 # ================= MAIN APP =================
 class DesktopApp(QWidget):
     def __init__(self):
@@ -69,8 +172,20 @@ class DesktopApp(QWidget):
         """)
 
         self.last_report_url = None
+        self.upload_worker = None
+        self.progress_worker = None
         self.build_ui()
 
+    # ---------- CLOSE ----------
+    def closeEvent(self, event):
+        self.stop_workers(self.progress_worker, self.upload_worker)
+        super().closeEvent(event)
+
+    def stop_workers(self, *workers):
+        for worker in workers:
+            if worker is not None:
+                worker.cancel()
+
     # ---------- BACKGROUND ----------
     def paintEvent(self, event):
         painter = QPainter(self)
@@ -153,55 +268,74 @@ class DesktopApp(QWidget):
         if not file:
             return
 
-        try:
-            self.status.setText("Uploading & analyzing...")
-            with open(file, "rb") as f:
-                r = requests.post(API_UPLOAD_URL, files={"file": f}, timeout=30)
+        upload_id = str(uuid.uuid4())
+        self.upload_btn.setEnabled(False)
+        self.status.setText("Uploading & analyzing...")
 
-            if r.status_code != 200:
-                QMessageBox.critical(self, "Error", r.text)
-                return
+        # subscribe first so no stage is missed, then send the file
+        self.progress_worker = ProgressWorker(upload_id, self)
+        self.progress_worker.progress.connect(self.on_upload_progress)
+        self.progress_worker.start()
 
-            resp = r.json()
-            data = resp.get("data", {})
-            self.last_report_url = resp.get("report")
-
-            # ---- SUMMARY (MATCH BACKEND) ----
-            self.total.setText(f"Total Rows\n{data.get('total_rows', '-')}")
-            self.pressure.setText(f"Avg Pressure\n{data.get('average_pressure', '-')}")
-            self.temp.setText(f"Avg Temperature\n{data.get('average_temperature', '-')}")
-
-            # ---- PIE CHART ----
-            self.pie.axes.clear()
-            dist = data.get("type_distribution", {})
-            if dist:
-                self.pie.axes.pie(
-                    dist.values(),
-                    labels=dist.keys(),
-                    autopct="%1.1f%%",
-                    startangle=140
-                )
-                self.pie.axes.set_title("Equipment Type Distribution")
-            self.pie.draw()
-
-            # ---- BAR CHART ----
-            self.bar.axes.clear()
-            self.bar.axes.bar(
-                ["Pressure", "Temperature"],
-                [
-                    data.get("average_pressure", 0),
-                    data.get("average_temperature", 0),
-                ],
-                color=["#2563eb", "#dc2626"]
-            )
-            self.bar.axes.set_title("System Averages")
-            self.bar.draw()
+        self.upload_worker = UploadWorker(file, upload_id, self)
+        self.upload_worker.succeeded.connect(self.on_upload_done)
+        self.upload_worker.failed.connect(self.on_upload_failed)
+        self.upload_worker.start()
 
-            self.status.setText("Upload successful ✔")
+    def on_upload_progress(self, state):
+        # errors and late events are handled by the upload result itself
+        stage = state.get("stage")
+        if stage == "error" or self.upload_btn.isEnabled():
+            return
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-            self.status.setText("Error")
+        text = f"{STAGE_LABELS.get(stage, stage)}... {state.get('percent', 0)}%"
+        if state.get("rows"):
+            text += f"  ({state['rows']:,} rows)"
+        self.status.setText(text)
+
+    def on_upload_failed(self, message):
+        self.upload_btn.setEnabled(True)
+        self.stop_workers(self.progress_worker)
+        QMessageBox.critical(self, "Error", message)
+        self.status.setText("Error")
+
+    def on_upload_done(self, resp):
+        self.upload_btn.setEnabled(True)
+        data = resp.get("data", {})
+        self.last_report_url = resp.get("report")
+
+        # ---- SUMMARY (MATCH BACKEND) ----
+        self.total.setText(f"Total Rows\n{data.get('total_rows', '-')}")
+        self.pressure.setText(f"Avg Pressure\n{data.get('average_pressure', '-')}")
+        self.temp.setText(f"Avg Temperature\n{data.get('average_temperature', '-')}")
+
+        # ---- PIE CHART ----
+        self.pie.axes.clear()
+        dist = data.get("type_distribution", {})
+        if dist:
+            self.pie.axes.pie(
+                dist.values(),
+                labels=dist.keys(),
+                autopct="%1.1f%%",
+                startangle=140
+            )
+            self.pie.axes.set_title("Equipment Type Distribution")
+        self.pie.draw()
+
+        # ---- BAR CHART ----
+        self.bar.axes.clear()
+        self.bar.axes.bar(
+            ["Pressure", "Temperature"],
+            [
+                data.get("average_pressure", 0),
+                data.get("average_temperature", 0),
+            ],
+            color=["#2563eb", "#dc2626"]
+        )
+        self.bar.axes.set_title("System Averages")
+        self.bar.draw()
+
+        self.status.setText("Upload successful ✔")
 
     # ---------- PDF ----------
     def download_pdf(self):
@@ -229,7 +363,13 @@ def main():
     app.setWindowIcon(QIcon(APP_ICON))
     win = DesktopApp()
     win.show()
-    sys.exit(app.exec_())
+    code = app.exec_()
+
+    # cancelled workers may still be blocked on the network; exit without
+    # waiting for them, like daemon threads
+    if any(w.isRunning() for w in CancellableWorker.detached):
+        os._exit(code)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -3,16 +3,29 @@ import axios from 'axios';
 import { Pie, Bar } from 'react-chartjs-2';
 import 'chart.js/auto';
 import History from './History';
+import Preview from './Preview';
 import './App.css';
 
+const API_BASE = 'http://127.0.0.1:8000';
+
+const STAGE_LABELS = {
+  receiving: 'Receiving file',
+  parsing: 'Parsing rows',
+  summarizing: 'Summarizing',
+  report: 'Building PDF report',
+  done: 'Finishing',
+};
+
 function App() {
   /* ---------------- STATES ---------------- */
   const [darkMode, setDarkMode] = useState(false);
   const [loading, setLoading] = useState(false);
   const [dragActive, setDragActive] = useState(false);
+  const [progress, setProgress] = useState(null);
 
   const [summary, setSummary] = useState(null);
   const [reportUrl, setReportUrl] = useState(null);
+  const [datasetId, setDatasetId] = useState(null);
   const [history, setHistory] = useState([]);
 
   const fileInputRef = useRef(null);
@@ -25,7 +38,7 @@ function App() {
   /* ---------------- FETCH LAST 5 HISTORY ---------------- */
   const fetchHistory = async () => {
     try {
-      const res = await axios.get('http://127.0.0.1:8000/datasets/', {
+      const res = await axios.get(`${API_BASE}/datasets/`, {
         params: { page: 1, page_size: 5 },
       });
       setHistory(res.data.items || []);
@@ -45,23 +58,36 @@ function App() {
     if (!file) return;
 
     setLoading(true);
+    const uploadId = crypto.randomUUID();
     const formData = new FormData();
     formData.append('file', file);
+    formData.append('upload_id', uploadId);
+
+    // subscribe to server-sent progress before the upload starts
+    const source = new EventSource(`${API_BASE}/upload/${uploadId}/progress/`);
+    source.addEventListener('progress', (ev) => {
+      const state = JSON.parse(ev.data);
+      setProgress(state);
+      if (state.stage === 'done' || state.stage === 'error') source.close();
+    });
 
     try {
       const res = await axios.post(
-        'http://127.0.0.1:8000/upload/',
+        `${API_BASE}/upload/`,
         formData,
         { headers: { 'Content-Type': 'multipart/form-data' } }
       );
 
       setSummary(res.data?.data || null);
       setReportUrl(res.data?.report || null);
+      setDatasetId(res.data?.dataset_id || null);
       fetchHistory();
     } catch (err) {
       console.error(err);
       alert('Upload failed (check backend logs)');
     } finally {
+      source.close();
+      setProgress(null);
       setLoading(false);
     }
   };
@@ -193,6 +219,21 @@ function App() {
             </span>
           </label>
 
+          {progress && progress.stage !== 'error' && (
+            <div className="progress">
+              <div className="muted">
+                {STAGE_LABELS[progress.stage] || progress.stage}… {progress.percent}%
+                {progress.rows ? ` (${progress.rows.toLocaleString()} rows)` : ''}
+              </div>
+              <div className="progress-track">
+                <div
+                  className="progress-bar"
+                  style={{ width: `${progress.percent}%` }}
+                />
+              </div>
+            </div>
+          )}
+
           {summary && (
             <div className="summary">
               <div>Total Rows: {summary.total_rows}</div>
@@ -211,12 +252,17 @@ function App() {
         {/* CHARTS */}
         {renderCharts()}
 
+        {/* PREVIEW */}
+        {/* keyed so paging state resets for each dataset */}
+        <Preview key={datasetId} apiBase={API_BASE} datasetId={datasetId} />
+
         {/* HISTORY */}
         <History
           items={history}
           onLoad={(item) => {
             setSummary(item.summary || null);
             setReportUrl(item.report_url || null);
+            setDatasetId(item.id);
           }}
         />
       </main>
@@ -0,0 +1,83 @@
+import React, { useState, useEffect } from 'react';
+import axios from 'axios';
+
+const PAGE_SIZE = 50;
+
+function Preview({ apiBase, datasetId }) {
+  const [offset, setOffset] = useState(0);
+  const [page, setPage] = useState(null);
+
+  /* each page is one seek + short parse on the backend */
+  useEffect(() => {
+    if (!datasetId) return;
+
+    let cancelled = false;
+    axios
+      .get(`${apiBase}/datasets/${datasetId}/preview/`, {
+        params: { offset, limit: PAGE_SIZE },
+      })
+      .then((res) => {
+        if (!cancelled) setPage(res.data);
+      })
+      .catch((err) => {
+        console.error('Preview fetch failed', err);
+        if (!cancelled) setPage(null);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [apiBase, datasetId, offset]);
+
+  if (!datasetId || !page) return null;
+
+  const total = page.total_rows || 0;
+  const last = Math.min(offset + PAGE_SIZE, total);
+
+  return (
+    <div className="preview-card">
+      <h3>Data Preview</h3>
+
+      <div className="preview-scroll">
+        <table className="preview-table">
+          <thead>
+            <tr>
+              {page.columns.map((col) => (
+                <th key={col}>{col}</th>
+              ))}
+            </tr>
+          </thead>
+          <tbody>
+            {page.rows.map((row, i) => (
+              <tr key={offset + i}>
+                {page.columns.map((col) => (
+                  <td key={col}>{String(row[col])}</td>
+                ))}
+              </tr>
+            ))}
+          </tbody>
+        </table>
+      </div>
+
+      <div className="preview-pager">
+        <button
+          disabled={offset === 0}
+          onClick={() => setOffset(Math.max(offset - PAGE_SIZE, 0))}
+        >
+          ◀ Prev
+        </button>
+        <span className="muted">
+          Rows {total ? offset + 1 : 0}–{last} of {total.toLocaleString()}
+        </span>
+        <button
+          disabled={last >= total}
+          onClick={() => setOffset(offset + PAGE_SIZE)}
+        >
+          Next ▶
+        </button>
+      </div>
+    </div>
+  );
+}
+
+export default Preview;